@@ -1,34 +1,70 @@
 from __future__ import annotations
 
-import json
+import os
+import re
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+import msgspec
+
 
 class FileCache:
-    def __init__(self, root: Path, ttl_seconds: int) -> None:
+    _enc = msgspec.msgpack.Encoder()
+    _dec = msgspec.msgpack.Decoder()
+
+    def __init__(self, root: Path, ttl_seconds: int, max_memory_entries: int = 128) -> None:
         self.root = root
         self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
         self.root.mkdir(parents=True, exist_ok=True)
+        self._mem: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._mem_lock = threading.Lock()
 
     def _path(self, key: str) -> Path:
-        safe = key.replace("/", "_").replace(":", "_")
-        return self.root / f"{safe}.json"
+        safe = re.sub(r"[^A-Za-z0-9._-]", "_", key)
+        return self.root / f"{safe}.mpk"
+
+    def get(self, key: str, ttl_seconds: int | None = None) -> Any | None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._mem_lock:
+            entry = self._mem.get(key)
+            if entry is not None:
+                if time.time() - entry[0] <= ttl:
+                    self._mem.move_to_end(key)
+                    return entry[1]
+                del self._mem[key]
 
-    def get(self, key: str) -> Any | None:
         path = self._path(key)
-        if not path.exists():
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
             return None
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-            if time.time() - payload.get("ts", 0) > self.ttl_seconds:
-                return None
-            return payload.get("value")
-        except Exception:
+            payload = self._dec.decode(data)
+        except msgspec.DecodeError:
             return None
+        ts = payload.get("ts", 0)
+        if time.time() - ts > ttl:
+            return None
+        value = payload.get("value")
+        self._remember(key, ts, value)
+        return value
 
     def set(self, key: str, value: Any) -> None:
         path = self._path(key)
         payload = {"ts": time.time(), "value": value}
-        path.write_text(json.dumps(payload), encoding="utf-8")
\ No newline at end of file
+        tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(self._enc.encode(payload))
+        os.replace(tmp, path)
+        self._remember(key, payload["ts"], value)
+
+    def _remember(self, key: str, ts: float, value: Any) -> None:
+        with self._mem_lock:
+            self._mem[key] = (ts, value)
+            self._mem.move_to_end(key)
+            while len(self._mem) > self.max_memory_entries:
+                self._mem.popitem(last=False)
+
@@ -6,6 +6,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
 
 @dataclass
 class AppConfig:
@@ -14,7 +19,7 @@ class AppConfig:
     @staticmethod
     def load(path: str | Path) -> "AppConfig":
         with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YamlLoader)
         return AppConfig(raw=data)
 
     def get(self, path: str, default: Any | None = None) -> Any:
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
-import json
 import os
 import random
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any
 
+import orjson
 import pandas as pd
 import requests
 
 from .cache import FileCache
 
 
+def _to_float_columns(df: pd.DataFrame, columns: list[str]) -> None:
+    try:
+        df[columns] = df[columns].astype("float64")
+    except (TypeError, ValueError):
+        for col in columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+
+
 @dataclass
 class DataProviderConfig:
     provider_primary: str
@@ -26,6 +35,28 @@ class DataProviderConfig:
     retry_max_delay_seconds: float
     rate_limit_enabled: bool
     rate_limit_min_interval_seconds: float
+    rate_limit_burst: int = 1
+
+
+class TokenBucket:
+    def __init__(self, capacity: int, rate: float) -> None:
+        self.capacity = float(max(1, capacity))
+        self.rate = rate
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
 
 
 class MarketDataFetcher:
@@ -33,10 +64,14 @@ class MarketDataFetcher:
         self.config = config
         self.cache = cache
         self.session = requests.Session()
-        self._last_call_ts = 0.0
+        self._bucket: TokenBucket | None = None
+        if config.rate_limit_enabled and config.rate_limit_min_interval_seconds > 0:
+            self._bucket = TokenBucket(
+                capacity=config.rate_limit_burst,
+                rate=1.0 / config.rate_limit_min_interval_seconds,
+            )
 
     def fetch_daily(self, symbol: str) -> pd.DataFrame:
-        self._throttle()
         providers = [self.config.provider_primary, self.config.provider_fallback]
         last_error: Exception | None = None
         for provider in providers:
@@ -80,8 +115,7 @@ class MarketDataFetcher:
             inplace=True,
         )
         df["date"] = pd.to_datetime(df["date"])
-        for col in ["open", "high", "low", "close", "volume"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+        _to_float_columns(df, ["open", "high", "low", "close", "volume"])
         df = df.sort_values("date").reset_index(drop=True)
         return df
 
@@ -100,22 +134,32 @@ class MarketDataFetcher:
         series = payload.get("Time Series (Daily)")
         if not isinstance(series, dict):
             raise RuntimeError(f"Unexpected Alpha Vantage response for {symbol}")
-        rows = []
-        for date_str, row in series.items():
-            rows.append(
-                {
-                    "date": date_str,
-                    "open": row.get("1. open"),
-                    "high": row.get("2. high"),
-                    "low": row.get("3. low"),
-                    "close": row.get("4. close"),
-                    "volume": row.get("6. volume") or row.get("5. volume"),
-                }
-            )
-        df = pd.DataFrame(rows)
+        n = len(series)
+        dates: list[Any] = [None] * n
+        opens: list[Any] = [None] * n
+        highs: list[Any] = [None] * n
+        lows: list[Any] = [None] * n
+        closes: list[Any] = [None] * n
+        volumes: list[Any] = [None] * n
+        for i, (date_str, row) in enumerate(series.items()):
+            dates[i] = date_str
+            opens[i] = row.get("1. open")
+            highs[i] = row.get("2. high")
+            lows[i] = row.get("3. low")
+            closes[i] = row.get("4. close")
+            volumes[i] = row.get("6. volume") or row.get("5. volume")
+        df = pd.DataFrame(
+            {
+                "date": dates,
+                "open": opens,
+                "high": highs,
+                "low": lows,
+                "close": closes,
+                "volume": volumes,
+            }
+        )
         df["date"] = pd.to_datetime(df["date"])
-        for col in ["open", "high", "low", "close", "volume"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+        _to_float_columns(df, ["open", "high", "low", "close", "volume"])
         df = df.sort_values("date").reset_index(drop=True)
         return df
 
@@ -129,13 +173,14 @@ class MarketDataFetcher:
         last_error: Exception | None = None
         for attempt in range(self.config.retry_max_attempts):
             try:
+                self._throttle()
                 response = self.session.get(url, params=params, timeout=30)
                 response.raise_for_status()
-                payload = response.json()
+                payload = orjson.loads(response.content)
                 if "Note" in payload or "Information" in payload:
                     raise RuntimeError(payload.get("Note") or payload.get("Information"))
                 if "Error Message" in payload or "code" in payload and payload.get("code") == 400:
-                    raise RuntimeError(json.dumps(payload)[:200])
+                    raise RuntimeError(orjson.dumps(payload)[:200].decode(errors="replace"))
                 if self.cache and self.config.cache_enabled:
                     self.cache.set(cache_key, payload)
                 return payload
@@ -153,11 +198,5 @@ class MarketDataFetcher:
         raise RuntimeError("Failed to fetch data")
 
     def _throttle(self) -> None:
-        if not self.config.rate_limit_enabled:
-            return
-        now = time.time()
-        elapsed = now - self._last_call_ts
-        min_interval = self.config.rate_limit_min_interval_seconds
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self._last_call_ts = time.time()
+        if self._bucket is not None:
+            self._bucket.acquire()
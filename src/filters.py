@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 
 import pandas as pd
@@ -22,17 +23,15 @@ def check_eligibility(
 ) -> EligibilityResult:
     if df.empty:
         return EligibilityResult(False, ["no_data"])
-    latest = df.iloc[-1]
-    idx = df.index[-1]
     reasons: list[str] = []
 
-    close = latest["close"]
-    sma50 = indicators.sma50.loc[idx]
-    sma200 = indicators.sma200.loc[idx]
-    high_52w = indicators.high_52w.loc[idx]
-    drawdown_20d = indicators.drawdown_20d.loc[idx]
+    close = float(df["close"].to_numpy()[-1])
+    sma50 = float(indicators.sma50.to_numpy()[-1])
+    sma200 = float(indicators.sma200.to_numpy()[-1])
+    high_52w = float(indicators.high_52w.to_numpy()[-1])
+    drawdown_20d = float(indicators.drawdown_20d.to_numpy()[-1])
 
-    if pd.isna(sma50) or pd.isna(sma200) or pd.isna(high_52w):
+    if math.isnan(sma50) or math.isnan(sma200) or math.isnan(high_52w):
         return EligibilityResult(False, ["insufficient_history"])
 
     if close < sma50 * (1 - sma50_tolerance):
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import bottleneck as bn
+import numpy as np
 import pandas as pd
 
 
@@ -14,28 +16,47 @@ class Indicators:
     high_20d: pd.Series
     high_52w: pd.Series
     drawdown_20d: pd.Series
+    dd_peak: pd.Series | None = None
+    dd_window: int | None = None
 
 
-def compute_indicators(df: pd.DataFrame) -> Indicators:
-    close = df["close"]
-    high = df["high"]
-    volume = df["volume"]
+def _move_mean(values: np.ndarray, window: int) -> np.ndarray:
+    if len(values) < window:
+        return np.full(len(values), np.nan)
+    return bn.move_mean(values, window, min_count=window)
 
-    sma25 = close.rolling(25).mean()
-    sma50 = close.rolling(50).mean()
-    sma200 = close.rolling(200).mean()
-    vol_ma20 = volume.rolling(20).mean()
-    high_20d = high.rolling(20).max().shift(1)
-    high_52w = high.rolling(252).max()
-    high_20d_max = high.rolling(20).max()
-    drawdown_20d = (high_20d_max - close) / high_20d_max
+
+def _move_max(values: np.ndarray, window: int) -> np.ndarray:
+    if len(values) < window:
+        return np.full(len(values), np.nan)
+    return bn.move_max(values, window, min_count=window)
+
+
+def compute_indicators(df: pd.DataFrame, dd_window: int | None = None) -> Indicators:
+    index = df.index
+    close = df["close"].to_numpy(dtype=np.float64)
+    high = df["high"].to_numpy(dtype=np.float64)
+    volume = df["volume"].to_numpy(dtype=np.float64)
+
+    high_20d_max = _move_max(high, 20)
+    high_20d = np.concatenate(([np.nan], high_20d_max[:-1]))
 
     return Indicators(
-        sma25=sma25,
-        sma50=sma50,
-        sma200=sma200,
-        vol_ma20=vol_ma20,
-        high_20d=high_20d,
-        high_52w=high_52w,
-        drawdown_20d=drawdown_20d,
+        sma25=pd.Series(_move_mean(close, 25), index=index),
+        sma50=pd.Series(_move_mean(close, 50), index=index),
+        sma200=pd.Series(_move_mean(close, 200), index=index),
+        vol_ma20=pd.Series(_move_mean(volume, 20), index=index),
+        high_20d=pd.Series(high_20d[: len(index)], index=index),
+        high_52w=pd.Series(_move_max(high, 252), index=index),
+        drawdown_20d=pd.Series((high_20d_max - close) / high_20d_max, index=index),
+        dd_peak=compute_dd_peak(df["close"], dd_window) if dd_window is not None else None,
+        dd_window=dd_window,
     )
+
+
+def compute_dd_peak(close: pd.Series, window: int) -> pd.Series:
+    rmax = close.rolling(window, min_periods=window).max().shift(1).to_numpy(dtype=np.float64)
+    c = close.to_numpy(dtype=np.float64)
+    valid = np.isfinite(c) & np.isfinite(rmax) & (rmax != 0.0)
+    dd = np.where(valid, 1.0 - c / np.where(valid, rmax, 1.0), np.nan)
+    return pd.Series(dd, index=close.index, dtype="float64")
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import argparse
+import atexit
 import json
 import logging
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
@@ -47,49 +49,76 @@ def build_data_config(config: AppConfig) -> DataProviderConfig:
         retry_max_delay_seconds=float(config.require("data.retry.max_delay_seconds")),
         rate_limit_enabled=bool(config.get("data.rate_limit.enabled", True)),
         rate_limit_min_interval_seconds=float(config.get("data.rate_limit.min_interval_seconds", 8.0)),
+        rate_limit_burst=int(config.get("data.rate_limit.burst", 1)),
+    )
+
+
+@dataclass(frozen=True)
+class EvalParams:
+    drawdown_max: float
+    high_52w_max_mult: float
+    sma50_tol: float
+    tol: float
+    pullback_25_enabled: bool
+    pullback_50_enabled: bool
+    breakout_20d_enabled: bool
+    breakout_volume_mult: float
+    dd_window: int
+    dd_max: float
+
+
+def build_eval_params(config: AppConfig, dd_window: int, dd_max: float) -> EvalParams:
+    return EvalParams(
+        drawdown_max=float(config.require("filters.drawdown_20d_max")),
+        high_52w_max_mult=float(config.require("filters.high_52w_max_multiple")),
+        sma50_tol=float(config.get("filters.sma50_tolerance", 0.0)),
+        tol=float(config.require("filters.tolerance")),
+        pullback_25_enabled=bool(config.require("triggers.pullback_25.enabled")),
+        pullback_50_enabled=bool(config.require("triggers.pullback_50.enabled")),
+        breakout_20d_enabled=bool(config.require("triggers.breakout_20d.enabled")),
+        breakout_volume_mult=float(config.require("triggers.breakout_volume_mult")),
+        dd_window=dd_window,
+        dd_max=dd_max,
     )
 
 
 def evaluate_symbol(
     symbol: str,
     df: pd.DataFrame,
-    config: AppConfig,
-    dd_window: int,
-    dd_max: float,
+    params: EvalParams,
 ) -> tuple[list[Signal], list[str]]:
-    indicators = compute_indicators(df)
+    indicators = compute_indicators(df, dd_window=params.dd_window)
     eligibility = check_eligibility(
         df,
         indicators,
-        drawdown_max=float(config.require("filters.drawdown_20d_max")),
-        high_52w_max_multiple=float(config.require("filters.high_52w_max_multiple")),
-        sma50_tolerance=float(config.get("filters.sma50_tolerance", 0.0)),
+        drawdown_max=params.drawdown_max,
+        high_52w_max_multiple=params.high_52w_max_mult,
+        sma50_tolerance=params.sma50_tol,
     )
     if not eligibility.eligible:
         return [], eligibility.reasons
 
-    tol = float(config.require("filters.tolerance"))
     results = []
-    if bool(config.require("triggers.pullback_25.enabled")):
-        res = pullback_25_bounce(df, indicators, tol)
+    if params.pullback_25_enabled:
+        res = pullback_25_bounce(df, indicators, params.tol)
         if res.fired:
             results.append(res)
-    if bool(config.require("triggers.pullback_50.enabled")):
+    if params.pullback_50_enabled:
         res = pullback_50_bounce(
             df,
             indicators,
-            tol,
-            drawdown_20d_max=float(config.require("filters.drawdown_20d_max")),
+            params.tol,
+            drawdown_20d_max=params.drawdown_max,
         )
         if res.fired:
             results.append(res)
-    if bool(config.require("triggers.breakout_20d.enabled")):
+    if params.breakout_20d_enabled:
         res = breakout_20d(
             df,
             indicators,
-            volume_mult=float(config.require("triggers.breakout_volume_mult")),
-            dd_window=dd_window,
-            dd_max=dd_max,
+            volume_mult=params.breakout_volume_mult,
+            dd_window=params.dd_window,
+            dd_max=params.dd_max,
             symbol=symbol,
         )
         if res.fired:
@@ -117,6 +146,7 @@ def main() -> int:
     dd_max = float(dd_params.get("dd_max", 0.25))
     logging.basicConfig(level=getattr(logging, str(config.get("app.log_level", "INFO")).upper()))
     data_config = build_data_config(config)
+    eval_params = build_eval_params(config, dd_window=dd_window, dd_max=dd_max)
 
     cache = None
     if bool(config.require("data.cache.enabled")):
@@ -124,22 +154,28 @@ def main() -> int:
 
     fetcher = MarketDataFetcher(data_config, cache=cache)
 
-    nfci_fetcher = NfciFetcher(config.require("nfci.csv_url"))
+    nfci_fetcher = NfciFetcher(
+        config.require("nfci.csv_url"),
+        cache=cache,
+        cache_ttl_seconds=int(config.get("nfci.cache_ttl_seconds", 6 * 3600)),
+    )
     nfci_series = nfci_fetcher.fetch_series()
 
     qqq_df = fetcher.fetch_daily("QQQ")
 
+    notifier = Notifier(
+        slack_enabled=bool(config.require("notifications.slack_enabled")),
+        pushover_enabled=bool(config.require("notifications.pushover_enabled")),
+        email_enabled=bool(config.get("notifications.email_enabled", True)),
+    )
+    atexit.register(notifier.close)
+
     tz_name = str(config.get("app.timezone", "UTC"))
     today_local = datetime.now(ZoneInfo(tz_name))
     try:
         regime_result = classify_regime(nfci_series, qqq_df, today_local)
     except Exception as exc:
         logging.error("Regime calculation failed: %s", exc)
-        notifier = Notifier(
-            slack_enabled=bool(config.require("notifications.slack_enabled")),
-            pushover_enabled=bool(config.require("notifications.pushover_enabled")),
-            email_enabled=bool(config.get("notifications.email_enabled", True)),
-        )
         notifier.notify_batch(
             f"Stock Alerts {datetime.now(timezone.utc).strftime('%Y-%m-%d')} UTC | Regime ERROR",
             [f"Regime calculation failed: {exc}"],
@@ -151,26 +187,35 @@ def main() -> int:
     eligible_symbols: list[str] = []
     rejected_reasons = Counter()
     skipped: list[str] = []
-    for symbol in symbols:
+
+    def _process(symbol: str) -> tuple[str, list[Signal], list[str], Exception | None]:
         try:
             df = fetcher.fetch_daily(symbol)
-            signals, reasons = evaluate_symbol(symbol, df, config, dd_window=dd_window, dd_max=dd_max)
-            if reasons:
-                rejected_reasons.update(reasons)
-            else:
-                eligible_symbols.append(symbol)
-            for signal in signals:
-                if regime_allows(regime_result.state, signal.trigger, config.raw):
-                    all_signals.append(signal)
+            signals, reasons = evaluate_symbol(
+                symbol,
+                df,
+                eval_params,
+            )
+            return symbol, signals, reasons, None
         except Exception as exc:
+            return symbol, [], [], exc
+
+    max_workers = max(1, min(int(config.get("data.max_workers", 8)), len(symbols)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_process, symbols))
+
+    for symbol, signals, reasons, exc in results:
+        if exc is not None:
             logging.warning("SKIP %s: %s", symbol, exc)
             skipped.append(symbol)
-
-    notifier = Notifier(
-        slack_enabled=bool(config.require("notifications.slack_enabled")),
-        pushover_enabled=bool(config.require("notifications.pushover_enabled")),
-        email_enabled=bool(config.get("notifications.email_enabled", True)),
-    )
+            continue
+        if reasons:
+            rejected_reasons.update(reasons)
+        else:
+            eligible_symbols.append(symbol)
+        for signal in signals:
+            if regime_allows(regime_result.state, signal.trigger, config.raw):
+                all_signals.append(signal)
 
     def _config_summary(cfg: AppConfig) -> list[str]:
         lines = [
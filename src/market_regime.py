@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -32,14 +34,20 @@ def _clip_0_1(value: float) -> float:
     return max(0.0, min(1.0, value))
 
 
+# Indexed by (price > ma50) << 2 | (ma50 > ma200) << 1 | (price > ma200); inputs are finite
+# (classify_regime rejects NaN history before scoring).
+_PRICE_SCORE_TABLE = (0, 5, 0, 5, 15, 15, 30, 30)
+
+
 def _price_score(price: float, ma50: float, ma200: float) -> int:
-    if price > ma50 and ma50 > ma200:
-        return 30
-    if price > ma50 and ma50 <= ma200:
-        return 15
-    if price <= ma50 and price > ma200:
-        return 5
-    return 0
+    idx = (price > ma50) << 2 | (ma50 > ma200) << 1 | (price > ma200)
+    return _PRICE_SCORE_TABLE[idx]
+
+
+def _trailing_mean(values: np.ndarray, pos: int, window: int) -> float:
+    if pos + 1 < window:
+        return math.nan
+    return float(values[pos - window + 1 : pos + 1].mean())
 
 
 def _state_from_score(score: float) -> tuple[str, float, bool]:
@@ -70,48 +78,38 @@ def classify_regime(
     if qqq_df.empty:
         raise RuntimeError("QQQ data missing")
 
-    qqq = qqq_df.copy()
-    qqq["date"] = pd.to_datetime(qqq["date"]).dt.date
-    qqq = qqq.sort_values("date")
-    qqq.set_index("date", inplace=True)
+    qqq = qqq_df.set_index(pd.DatetimeIndex(qqq_df["date"]))
+    if not qqq.index.is_monotonic_increasing:
+        qqq = qqq.sort_index()
 
-    if as_of_date.date() not in qqq.index:
-        eligible = qqq.index[qqq.index <= as_of_date.date()]
-        if len(eligible) == 0:
-            raise RuntimeError("No QQQ trading day on or before today")
-        as_of = eligible[-1]
-    else:
-        as_of = as_of_date.date()
+    as_of = qqq.index.asof(pd.Timestamp(as_of_date.date()))
+    if pd.isna(as_of):
+        raise RuntimeError("No QQQ trading day on or before today")
 
-    close = qqq["close"]
-    ma50 = close.rolling(50).mean()
-    ma200 = close.rolling(200).mean()
+    pos = qqq.index.get_loc(as_of)
+    close = qqq["close"].to_numpy(dtype=np.float64)
+    ma50_t = _trailing_mean(close, pos, 50)
+    ma200_t = _trailing_mean(close, pos, 200)
 
-    nfci_daily = nfci_series.reindex(qqq.index).ffill()
+    if not isinstance(nfci_series.index, pd.DatetimeIndex):
+        nfci_series = pd.Series(nfci_series.to_numpy(), index=pd.DatetimeIndex(nfci_series.index))
+    nfci = nfci_series.reindex(qqq.index).ffill().to_numpy(dtype=np.float64)
 
-    if as_of not in nfci_daily.index:
-        raise RuntimeError("NFCI alignment failed")
-
-    l = nfci_daily
-    s_1w = l - l.shift(5)
-    s_4w = l - l.shift(20)
-    s_1w_prev = s_1w.shift(5)
-
-    required = [l, s_1w, s_4w, s_1w_prev, ma50, ma200]
-    if any(pd.isna(series.loc[as_of]) for series in required):
+    if pos < 20:
+        raise RuntimeError("Insufficient history for regime score calculation")
+    l_t = float(nfci[pos])
+    s_1w_t = l_t - float(nfci[pos - 5])
+    s_4w_t = l_t - float(nfci[pos - 20])
+    s_1w_prev_t = float(nfci[pos - 5]) - float(nfci[pos - 10])
+    price = float(close[pos])
+
+    required = [l_t, s_1w_t, s_4w_t, s_1w_prev_t, ma50_t, ma200_t]
+    if any(math.isnan(value) for value in required):
         raise RuntimeError("Insufficient history for regime score calculation")
-
-    l_t = float(l.loc[as_of])
-    s_1w_t = float(s_1w.loc[as_of])
-    s_4w_t = float(s_4w.loc[as_of])
-    s_1w_prev_t = float(s_1w_prev.loc[as_of])
 
     risk_off_trigger = (s_1w_t > 0.05 and s_1w_prev_t > 0.05) or (s_4w_t > 0.10)
     risk_on_trigger = (s_1w_t < -0.05 and s_1w_prev_t < -0.05) or (s_4w_t < -0.10)
 
-    price = float(close.loc[as_of])
-    ma50_t = float(ma50.loc[as_of])
-    ma200_t = float(ma200.loc[as_of])
     price_score = _price_score(price, ma50_t, ma200_t)
 
     level_score = 35.0 * _clip_0_1((-l_t + 0.5) / 1.2)
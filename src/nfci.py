@@ -6,6 +6,8 @@ from dataclasses import dataclass
 import pandas as pd
 import requests
 
+from .cache import FileCache
+
 
 @dataclass
 class NfciData:
@@ -20,10 +22,15 @@ class NfciFetcher:
         csv_url: str,
         fred_nfci_url: str = "https://fred.stlouisfed.org/graph/fredgraph.csv?id=NFCI",
         fred_anfci_url: str = "https://fred.stlouisfed.org/graph/fredgraph.csv?id=ANFCI",
+        cache: FileCache | None = None,
+        cache_ttl_seconds: int = 6 * 3600,
     ) -> None:
         self.csv_url = csv_url
         self.fred_nfci_url = fred_nfci_url
         self.fred_anfci_url = fred_anfci_url
+        self.cache = cache
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.session = requests.Session()
 
     def fetch_latest(self) -> NfciData:
         try:
@@ -36,13 +43,13 @@ class NfciFetcher:
         if df.empty:
             raise RuntimeError("NFCI series empty")
         df = df.sort_values("date")
-        series = pd.Series(df["value"].values, index=pd.to_datetime(df["date"]).dt.date)
+        series = pd.Series(df["value"].to_numpy(), index=pd.DatetimeIndex(df["date"]))
         return series
 
     def _fetch_chicagofed(self) -> NfciData:
-        response = requests.get(self.csv_url, timeout=30)
+        response = self.session.get(self.csv_url, timeout=30)
         response.raise_for_status()
-        df = pd.read_csv(io.StringIO(response.text))
+        df = pd.read_csv(io.BytesIO(response.content))
         if df.empty:
             raise RuntimeError("NFCI CSV empty")
         latest = df.iloc[-1]
@@ -67,22 +74,34 @@ class NfciFetcher:
             raise RuntimeError("FRED NFCI data empty")
 
         latest = merged.iloc[-1]
-        date = str(latest["date"])
+        date = str(latest["date"].date())
         nfci = float(latest["value_nfci"])
         anfci = None
         if pd.notna(latest.get("value_anfci")):
             anfci = float(latest["value_anfci"])
         return NfciData(nfci=nfci, anfci=anfci, date=date)
 
-    @staticmethod
-    def _fetch_fred_series(url: str) -> pd.DataFrame:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        df = pd.read_csv(io.StringIO(response.text))
-        if df.empty or len(df.columns) < 2:
+    def _fetch_fred_series(self, url: str) -> pd.DataFrame:
+        cache_key = f"fred_{url}"
+        content = None
+        if self.cache:
+            content = self.cache.get(cache_key, ttl_seconds=self.cache_ttl_seconds)
+        if content is None:
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+            content = response.content
+            if self.cache:
+                self.cache.set(cache_key, content)
+        df = pd.read_csv(
+            io.BytesIO(content),
+            names=["date", "value"],
+            header=0,
+            parse_dates=["date"],
+            na_values=["."],
+            dtype={"value": "float64"},
+            engine="c",
+        )
+        if df.empty:
             raise RuntimeError("FRED CSV empty")
-        df = df.rename(columns={df.columns[0]: "date", df.columns[1]: "value"})
-        df["date"] = pd.to_datetime(df["date"]).dt.date.astype(str)
-        df["value"] = pd.to_numeric(df["value"], errors="coerce")
         df = df.dropna(subset=["value"])
         return df
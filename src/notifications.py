@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Iterable
 
 import requests
 import smtplib
 from email.message import EmailMessage
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+SLACK_MAX_CHARS = 3500
+MESSAGE_SEPARATOR = "\n---\n"
 
 
 @dataclass
@@ -15,20 +23,92 @@ class NotificationMessage:
     body: str
 
 
+@dataclass(frozen=True, slots=True)
+class NotifierConfig:
+    slack_webhook: str | None
+    pushover_user: str | None
+    pushover_token: str | None
+    smtp_host: str | None
+    smtp_port: int
+    smtp_user: str | None
+    smtp_pass: str | None
+    smtp_from: str | None
+    smtp_to: str | None
+    smtp_tls: bool
+
+    @classmethod
+    def from_env(cls) -> "NotifierConfig":
+        smtp_user = os.environ.get("SMTP_USER")
+        return cls(
+            slack_webhook=os.environ.get("SLACK_WEBHOOK_URL"),
+            pushover_user=os.environ.get("PUSHOVER_USER_KEY"),
+            pushover_token=os.environ.get("PUSHOVER_APP_TOKEN"),
+            smtp_host=os.environ.get("SMTP_HOST"),
+            smtp_port=int(os.environ.get("SMTP_PORT") or "587"),
+            smtp_user=smtp_user,
+            smtp_pass=os.environ.get("SMTP_PASSWORD"),
+            smtp_from=os.environ.get("SMTP_FROM") or smtp_user,
+            smtp_to=os.environ.get("MAIL_ADDRESS_NOTIFICATION_TO"),
+            smtp_tls=os.environ.get("SMTP_TLS", "true").lower() in {"1", "true", "yes", "on"},
+        )
+
+
 class Notifier:
-    def __init__(self, slack_enabled: bool, pushover_enabled: bool, email_enabled: bool) -> None:
+    def __init__(
+        self,
+        slack_enabled: bool,
+        pushover_enabled: bool,
+        email_enabled: bool,
+        config: NotifierConfig | None = None,
+        parallel: bool = True,
+    ) -> None:
         self.slack_enabled = slack_enabled
         self.pushover_enabled = pushover_enabled
         self.email_enabled = email_enabled
+        self._cfg = config or NotifierConfig.from_env()
+        self._smtp: smtplib.SMTP | None = None
+        self._smtp_lock = threading.Lock()
+        self._exec = ThreadPoolExecutor(max_workers=3, thread_name_prefix="notify") if parallel else None
+        self._http = requests.Session()
+        # Only retry POSTs that were never processed (connect errors, 429); a 5xx or read
+        # timeout may already have delivered the alert. Exhausted retries return the response.
+        retry = Retry(
+            total=2,
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=[429],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        )
+        self._http.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry))
+
+    def __enter__(self) -> "Notifier":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._exec is not None:
+            self._exec.shutdown(wait=True)
+        self._http.close()
+        with self._smtp_lock:
+            self._close_smtp()
 
     def notify(self, message: NotificationMessage) -> None:
-        sent = False
+        senders = []
         if self.slack_enabled:
-            sent = self._send_slack(message) or sent
+            senders.append(self._send_slack)
         if self.pushover_enabled:
-            sent = self._send_pushover(message) or sent
+            senders.append(self._send_pushover)
         if self.email_enabled:
-            sent = self._send_email(message) or sent
+            senders.append(self._send_email)
+        if self._exec is not None and len(senders) > 1:
+            futures = [self._exec.submit(send, message) for send in senders]
+            results = [f.result() for f in futures]
+        else:
+            results = [send(message) for send in senders]
+        sent = any(results)
         if not sent:
             print(self._format_stdout(message))
 
@@ -36,17 +116,26 @@ class Notifier:
         body = "\n".join(lines)
         self.notify(NotificationMessage(title=title, body=body))
 
+    def notify_many(self, title: str, messages: list[NotificationMessage]) -> None:
+        if not messages:
+            return
+        body = MESSAGE_SEPARATOR.join(m.body for m in messages)
+        self.notify(NotificationMessage(title=title, body=body))
+
     def _send_slack(self, message: NotificationMessage) -> bool:
-        webhook = os.getenv("SLACK_WEBHOOK_URL")
+        webhook = self._cfg.slack_webhook
         if not webhook:
             return False
-        payload = {"text": f"*{message.title}*\n{message.body}"}
-        response = requests.post(webhook, json=payload, timeout=20)
-        return response.status_code < 300
+        ok = True
+        for chunk in _chunk_lines(message.body, SLACK_MAX_CHARS):
+            payload = {"text": f"*{message.title}*\n{chunk}"}
+            response = self._http.post(webhook, json=payload, timeout=20)
+            ok = response.status_code < 300 and ok
+        return ok
 
     def _send_pushover(self, message: NotificationMessage) -> bool:
-        user_key = os.getenv("PUSHOVER_USER_KEY")
-        token = os.getenv("PUSHOVER_APP_TOKEN")
+        user_key = self._cfg.pushover_user
+        token = self._cfg.pushover_token
         if not user_key or not token:
             return False
         payload = {
@@ -55,34 +144,78 @@ class Notifier:
             "title": message.title,
             "message": message.body,
         }
-        response = requests.post("https://api.pushover.net/1/messages.json", data=payload, timeout=20)
+        response = self._http.post("https://api.pushover.net/1/messages.json", data=payload, timeout=20)
         return response.status_code < 300
 
     def _send_email(self, message: NotificationMessage) -> bool:
-        to_addr = os.getenv("MAIL_ADDRESS_NOTIFICATION_TO")
-        host = os.getenv("SMTP_HOST")
-        port = int(os.getenv("SMTP_PORT", "587"))
-        user = os.getenv("SMTP_USER")
-        password = os.getenv("SMTP_PASSWORD")
-        from_addr = os.getenv("SMTP_FROM") or user
-        tls_enabled = os.getenv("SMTP_TLS", "true").lower() in {"1", "true", "yes", "on"}
-
-        if not to_addr or not host or not user or not password or not from_addr:
+        cfg = self._cfg
+        if not cfg.smtp_to or not cfg.smtp_host or not cfg.smtp_user or not cfg.smtp_pass or not cfg.smtp_from:
             return False
 
         msg = EmailMessage()
         msg["Subject"] = message.title
-        msg["From"] = from_addr
-        msg["To"] = to_addr
+        msg["From"] = cfg.smtp_from
+        msg["To"] = cfg.smtp_to
         msg.set_content(message.body)
 
-        with smtplib.SMTP(host, port, timeout=20) as server:
-            if tls_enabled:
-                server.starttls()
-            server.login(user, password)
-            server.send_message(msg)
+        with self._smtp_lock:
+            try:
+                self._smtp_conn().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self._close_smtp()
+                self._smtp_conn().send_message(msg)
         return True
 
+    def _smtp_conn(self) -> smtplib.SMTP:
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_smtp()
+        cfg = self._cfg
+        server = smtplib.SMTP(cfg.smtp_host, cfg.smtp_port, timeout=20)
+        try:
+            if cfg.smtp_tls:
+                server.starttls()
+            server.login(cfg.smtp_user, cfg.smtp_pass)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+
+    def _close_smtp(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
     @staticmethod
     def _format_stdout(message: NotificationMessage) -> str:
         return f"{message.title}\n{message.body}"
+
+
+def _chunk_lines(text: str, limit: int) -> list[str]:
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    for line in text.split("\n"):
+        while len(line) > limit:
+            if current:
+                chunks.append("\n".join(current))
+                current, size = [], 0
+            chunks.append(line[:limit])
+            line = line[limit:]
+        if current and size + 1 + len(line) > limit:
+            chunks.append("\n".join(current))
+            current, size = [], 0
+        size += len(line) + (1 if current else 0)
+        current.append(line)
+    if current or not chunks:
+        chunks.append("\n".join(current))
+    return chunks
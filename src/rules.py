@@ -1,25 +1,44 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from .config import YamlLoader
 
-@dataclass
+
+@dataclass(frozen=True)
 class RulesConfig:
     rules: list[dict[str, Any]]
+    _by_id: dict[str, dict[str, Any]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        by_id: dict[str, dict[str, Any]] = {}
+        for rule in self.rules:
+            rule_id = rule.get("rule_id")
+            if rule_id is not None:
+                by_id.setdefault(rule_id, rule)
+        object.__setattr__(self, "_by_id", by_id)
 
     @staticmethod
     def load(path: str | Path) -> "RulesConfig":
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        rules = data.get("rules", []) if isinstance(data, dict) else []
-        return RulesConfig(rules=rules)
+        st = os.stat(path)
+        return _load_rules(os.fspath(path), st.st_mtime_ns, st.st_size)
 
     def get_rule(self, rule_id: str) -> dict[str, Any]:
-        for rule in self.rules:
-            if rule.get("rule_id") == rule_id:
-                return rule
-        raise ValueError(f"Rule not found: {rule_id}")
+        try:
+            return self._by_id[rule_id]
+        except KeyError:
+            raise ValueError(f"Rule not found: {rule_id}") from None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_rules(path: str, mtime_ns: int, size: int) -> RulesConfig:
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=YamlLoader)
+    rules = data.get("rules", []) if isinstance(data, dict) else []
+    return RulesConfig(rules=rules)
@@ -1,16 +1,84 @@
 from __future__ import annotations
 
-import json
+import atexit
+import hashlib
+import logging
 import os
-from dataclasses import asdict
+import queue
+import threading
+import time
+from dataclasses import dataclass
 from typing import Any
 
 import gspread
+import orjson
 from google.oauth2.service_account import Credentials
 
 from .market_regime import RegimeScoreResult
 
 
+_HEADER = [
+    "date",
+    "state",
+    "total_score",
+    "nfci_L",
+    "s_1w",
+    "s_4w",
+    "price_close",
+    "ma50",
+    "ma200",
+    "price_score",
+    "level_score",
+    "trend_score",
+    "abs_penalty",
+    "max_exposure",
+    "allow_new_entries",
+    "risk_off_trigger",
+    "risk_on_trigger",
+    "notes",
+    "regime_json",
+    "hits_json",
+]
+
+_FLUSH_BATCH_ROWS = 50
+_FLUSH_INTERVAL_SECONDS = 5.0
+
+_SheetKey = tuple[str, str | None, str | None]
+# Items are (sheet key, row); None asks the flusher to write its pending batch immediately.
+_QUEUE: queue.Queue[tuple[_SheetKey, list[str]] | None] = queue.Queue(maxsize=1024)
+_flusher: threading.Thread | None = None
+_flusher_lock = threading.Lock()
+
+
+@dataclass
+class _SheetHandle:
+    worksheet: gspread.Worksheet
+    header_written: bool = False
+
+
+_WORKSHEETS: dict[_SheetKey, _SheetHandle] = {}
+_WORKSHEETS_LOCK = threading.Lock()
+
+
+def _get_worksheet(sheet_url: str, cred_file: str | None, cred_json: str | None) -> _SheetHandle:
+    cred_fp = hashlib.blake2b(cred_json.encode(), digest_size=8).hexdigest() if cred_json else None
+    key = (sheet_url, cred_file, cred_fp)
+    with _WORKSHEETS_LOCK:
+        handle = _WORKSHEETS.get(key)
+        if handle is not None:
+            return handle
+        if cred_json:
+            creds_info = orjson.loads(cred_json)
+            scopes = ["https://www.googleapis.com/auth/spreadsheets"]
+            creds = Credentials.from_service_account_info(creds_info, scopes=scopes)
+            client = gspread.authorize(creds)
+        else:
+            client = gspread.service_account(filename=cred_file)
+        handle = _SheetHandle(worksheet=client.open_by_url(sheet_url).sheet1)
+        _WORKSHEETS[key] = handle
+        return handle
+
+
 def append_regime_log(
     regime: RegimeScoreResult,
     hits: list[dict[str, Any]],
@@ -21,39 +89,6 @@ def append_regime_log(
     if not sheet_url or (not cred_file and not cred_json):
         return
 
-    if cred_json:
-        creds_info = json.loads(cred_json)
-        scopes = ["https://www.googleapis.com/auth/spreadsheets"]
-        creds = Credentials.from_service_account_info(creds_info, scopes=scopes)
-        client = gspread.authorize(creds)
-    else:
-        client = gspread.service_account(filename=cred_file)
-    worksheet = client.open_by_url(sheet_url).sheet1
-
-    header = [
-        "date",
-        "state",
-        "total_score",
-        "nfci_L",
-        "s_1w",
-        "s_4w",
-        "price_close",
-        "ma50",
-        "ma200",
-        "price_score",
-        "level_score",
-        "trend_score",
-        "abs_penalty",
-        "max_exposure",
-        "allow_new_entries",
-        "risk_off_trigger",
-        "risk_on_trigger",
-        "notes",
-        "regime_json",
-        "hits_json",
-    ]
-
-    regime_dict = asdict(regime)
     row = [
         regime.date,
         regime.state,
@@ -73,9 +108,92 @@ def append_regime_log(
         str(regime.risk_off_trigger),
         str(regime.risk_on_trigger),
         regime.notes,
-        json.dumps(regime_dict, ensure_ascii=True),
-        json.dumps(hits, ensure_ascii=True),
+        orjson.dumps(regime.__dict__).decode(),
+        orjson.dumps(hits).decode(),
     ]
 
-    worksheet.update("A1", [header], value_input_option="RAW")
-    worksheet.append_row(row, value_input_option="RAW")
+    _ensure_flusher()
+    _QUEUE.put(((sheet_url, cred_file, cred_json), row))
+
+
+def flush() -> None:
+    if _flusher is None:
+        return
+    _QUEUE.put(None)
+    _QUEUE.join()
+
+
+def _ensure_flusher() -> None:
+    global _flusher
+    with _flusher_lock:
+        if _flusher is not None:
+            return
+        _flusher = threading.Thread(target=_flush_loop, name="sheets-flusher", daemon=True)
+        _flusher.start()
+        atexit.register(flush)
+
+
+def _flush_loop() -> None:
+    while True:
+        item = _QUEUE.get()
+        taken = 1
+        batch = [item] if item is not None else []
+        deadline = time.monotonic() + _FLUSH_INTERVAL_SECONDS
+        while item is not None and len(batch) < _FLUSH_BATCH_ROWS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _QUEUE.get(timeout=remaining)
+            except queue.Empty:
+                break
+            taken += 1
+            if item is not None:
+                batch.append(item)
+        try:
+            _write_batch(batch)
+        finally:
+            for _ in range(taken):
+                _QUEUE.task_done()
+
+
+def _write_batch(batch: list[tuple[_SheetKey, list[str]]]) -> None:
+    grouped: dict[_SheetKey, list[list[str]]] = {}
+    for key, row in batch:
+        grouped.setdefault(key, []).append(row)
+    for key, rows in grouped.items():
+        try:
+            _write_rows(_get_worksheet(*key), _HEADER, rows)
+        except Exception as exc:
+            logging.warning("Sheets log write failed (%d rows): %s", len(rows), exc)
+
+
+def _row_data(values: list[str]) -> dict[str, Any]:
+    return {"values": [{"userEnteredValue": {"stringValue": value}} for value in values]}
+
+
+def _write_rows(handle: _SheetHandle, header: list[str], rows: list[list[str]]) -> None:
+    worksheet = handle.worksheet
+    # Header rewrite and row append go out as one spreadsheets.batchUpdate; appendCells picks the row server-side.
+    requests: list[dict[str, Any]] = []
+    if not handle.header_written:
+        requests.append(
+            {
+                "updateCells": {
+                    "start": {"sheetId": worksheet.id, "rowIndex": 0, "columnIndex": 0},
+                    "rows": [_row_data(header)],
+                    "fields": "userEnteredValue",
+                }
+            }
+        )
+    requests.append(
+        {
+            "appendCells": {
+                "sheetId": worksheet.id,
+                "rows": [_row_data(row) for row in rows],
+                "fields": "userEnteredValue",
+            }
+        }
+    )
+    worksheet.spreadsheet.batch_update({"requests": requests})
+    handle.header_written = True
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
+import math
 
+import numpy as np
 import pandas as pd
 
-from .indicators import Indicators
+from .indicators import Indicators, compute_dd_peak
+
+_log = logging.getLogger(__name__)
 
 
 @dataclass
@@ -17,20 +21,33 @@ class TriggerResult:
 def pullback_25_bounce(df: pd.DataFrame, indicators: Indicators, tol: float) -> TriggerResult:
     if df.empty:
         return TriggerResult(False, "no_data")
-    latest = df.iloc[-1]
-    idx = df.index[-1]
-    sma25 = indicators.sma25.loc[idx]
-    vol_ma20 = indicators.vol_ma20.loc[idx]
-    if pd.isna(sma25) or pd.isna(vol_ma20):
+    close_last = float(df["close"].to_numpy()[-1])
+    low_last = float(df["low"].to_numpy()[-1])
+    vol_last = float(df["volume"].to_numpy()[-1])
+    sma25 = float(indicators.sma25.to_numpy()[-1])
+    vol_ma20 = float(indicators.vol_ma20.to_numpy()[-1])
+    if math.isnan(sma25) or math.isnan(vol_ma20):
         return TriggerResult(False, "insufficient_history")
     cond = (
-        latest["low"] <= sma25 * (1 + tol)
-        and latest["close"] >= sma25
-        and latest["volume"] <= vol_ma20
+        low_last <= sma25 * (1 + tol)
+        and close_last >= sma25
+        and vol_last <= vol_ma20
     )
     return TriggerResult(cond, "PULLBACK_25_BOUNCE")
 
 
+def pullback_25_bounce_vec(
+    lows: np.ndarray,
+    closes: np.ndarray,
+    volumes: np.ndarray,
+    sma25: np.ndarray,
+    vol_ma20: np.ndarray,
+    tol: float,
+) -> np.ndarray:
+    valid = np.isfinite(sma25) & np.isfinite(vol_ma20)
+    return valid & (lows <= sma25 * (1 + tol)) & (closes >= sma25) & (volumes <= vol_ma20)
+
+
 def pullback_50_bounce(
     df: pd.DataFrame,
     indicators: Indicators,
@@ -39,20 +56,32 @@ def pullback_50_bounce(
 ) -> TriggerResult:
     if df.empty:
         return TriggerResult(False, "no_data")
-    latest = df.iloc[-1]
-    idx = df.index[-1]
-    sma50 = indicators.sma50.loc[idx]
-    drawdown_20d = indicators.drawdown_20d.loc[idx]
-    if pd.isna(sma50) or pd.isna(drawdown_20d):
+    close_last = float(df["close"].to_numpy()[-1])
+    low_last = float(df["low"].to_numpy()[-1])
+    sma50 = float(indicators.sma50.to_numpy()[-1])
+    drawdown_20d = float(indicators.drawdown_20d.to_numpy()[-1])
+    if math.isnan(sma50) or math.isnan(drawdown_20d):
         return TriggerResult(False, "insufficient_history")
     cond = (
-        latest["low"] <= sma50 * (1 + tol)
-        and latest["close"] >= sma50
+        low_last <= sma50 * (1 + tol)
+        and close_last >= sma50
         and drawdown_20d <= drawdown_20d_max
     )
     return TriggerResult(cond, "PULLBACK_50_BOUNCE")
 
 
+def pullback_50_bounce_vec(
+    lows: np.ndarray,
+    closes: np.ndarray,
+    sma50: np.ndarray,
+    drawdown_20d: np.ndarray,
+    tol: float,
+    drawdown_20d_max: float,
+) -> np.ndarray:
+    valid = np.isfinite(sma50) & np.isfinite(drawdown_20d)
+    return valid & (lows <= sma50 * (1 + tol)) & (closes >= sma50) & (drawdown_20d <= drawdown_20d_max)
+
+
 def breakout_20d(
     df: pd.DataFrame,
     indicators: Indicators,
@@ -63,40 +92,35 @@ def breakout_20d(
 ) -> TriggerResult:
     if df.empty:
         return TriggerResult(False, "no_data")
-    latest = df.iloc[-1]
-    idx = df.index[-1]
-    high_20d = indicators.high_20d.loc[idx]
-    vol_ma20 = indicators.vol_ma20.loc[idx]
-    dd_value = compute_dd_peak(df["close"], dd_window).loc[idx]
-    logging.info(
-        "DD_METRIC symbol=%s dd_metric=peak_N dd_window=%s dd_value=%s",
-        symbol,
-        dd_window,
-        "nan" if pd.isna(dd_value) else f"{float(dd_value):.6f}",
-    )
-    if pd.isna(high_20d) or pd.isna(vol_ma20):
+    close_last = float(df["close"].to_numpy()[-1])
+    vol_last = float(df["volume"].to_numpy()[-1])
+    high_20d = float(indicators.high_20d.to_numpy()[-1])
+    vol_ma20 = float(indicators.vol_ma20.to_numpy()[-1])
+    if indicators.dd_peak is not None and indicators.dd_window == dd_window:
+        dd_value = float(indicators.dd_peak.to_numpy()[-1])
+    else:
+        dd_value = float(compute_dd_peak(df["close"], dd_window).to_numpy()[-1])
+    if _log.isEnabledFor(logging.INFO):
+        _log.info(
+            "DD_METRIC symbol=%s dd_metric=peak_N dd_window=%s dd_value=%.6f",
+            symbol,
+            dd_window,
+            dd_value,
+        )
+    if math.isnan(high_20d) or math.isnan(vol_ma20):
         return TriggerResult(False, "insufficient_history")
-    if not pd.isna(dd_value) and dd_value > dd_max:
-        logging.info(
+    if not math.isnan(dd_value) and dd_value > dd_max:
+        _log.info(
             "EXCLUDE symbol=%s exclude_reason_rule_id=FILTER_DD_002 dd_metric=peak_N dd_window=%s dd_value=%.6f dd_max=%.6f",
             symbol,
             dd_window,
-            float(dd_value),
+            dd_value,
             dd_max,
         )
         return TriggerResult(False, "drawdown_too_large")
     cond = (
-        latest["close"] > high_20d
-        and latest["close"] <= high_20d * 1.05
-        and latest["volume"] >= vol_ma20 * volume_mult
+        close_last > high_20d
+        and close_last <= high_20d * 1.05
+        and vol_last >= vol_ma20 * volume_mult
     )
     return TriggerResult(cond, "BREAKOUT_20D")
-
-
-def compute_dd_peak(close: pd.Series, window: int) -> pd.Series:
-    rolling_max = close.rolling(window).max().shift(1)
-    dd = pd.Series(index=close.index, dtype="float64")
-    dd[:] = pd.NA
-    valid = (~close.isna()) & (~rolling_max.isna()) & (rolling_max != 0)
-    dd.loc[valid] = 1 - (close.loc[valid] / rolling_max.loc[valid])
-    return dd
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.cache import FileCache
+
+
+def test_cache_roundtrip(tmp_path: Path) -> None:
+    cache = FileCache(tmp_path, ttl_seconds=60)
+    payload = {"values": [{"datetime": "2024-01-02", "close": "100.5"}], "status": "ok"}
+    cache.set("twelvedata_QQQ", payload)
+    assert cache.get("twelvedata_QQQ") == payload
+
+
+def test_cache_miss_and_expiry(tmp_path: Path) -> None:
+    cache = FileCache(tmp_path, ttl_seconds=-1)
+    assert cache.get("missing") is None
+    cache.set("expired", {"a": 1})
+    assert cache.get("expired") is None
+
+
+def test_cache_ignores_corrupt_file(tmp_path: Path) -> None:
+    cache = FileCache(tmp_path, ttl_seconds=60)
+    cache.set("twelvedata_QQQ", {"a": 1})
+    cache._path("twelvedata_QQQ").write_bytes(b"\xc1")
+    assert FileCache(tmp_path, ttl_seconds=60).get("twelvedata_QQQ") is None
+
+
+def test_cache_serves_repeat_reads_from_memory(tmp_path: Path) -> None:
+    cache = FileCache(tmp_path, ttl_seconds=60, max_memory_entries=1)
+    cache.set("a", {"v": 1})
+    cache._path("a").unlink()
+    assert cache.get("a") == {"v": 1}
+    cache.set("b", {"v": 2})
+    assert cache.get("a") is None
+
+
+def test_cache_ttl_override(tmp_path: Path) -> None:
+    cache = FileCache(tmp_path, ttl_seconds=-1)
+    cache.set("fred_https://fred.stlouisfed.org/graph/fredgraph.csv?id=NFCI", b"date,value\n")
+    reader = FileCache(tmp_path, ttl_seconds=-1)
+    key = "fred_https://fred.stlouisfed.org/graph/fredgraph.csv?id=NFCI"
+    assert reader.get(key) is None
+    assert reader.get(key, ttl_seconds=60) == b"date,value\n"
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import math
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from src.cache import FileCache
+from src.data_provider import DataProviderConfig, MarketDataFetcher, TokenBucket, _to_float_columns
+
+
+def test_token_bucket_allows_burst_then_paces() -> None:
+    bucket = TokenBucket(capacity=3, rate=20.0)
+    start = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - start < 0.04
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.04
+
+
+def test_to_float_columns_coerces_malformed_values() -> None:
+    df = pd.DataFrame({"close": ["1.5", "2.5"], "volume": ["100", "n/a"]})
+    _to_float_columns(df, ["close", "volume"])
+    assert df["close"].tolist() == [1.5, 2.5]
+    assert df["volume"].iloc[0] == 100.0
+    assert math.isnan(df["volume"].iloc[1])
+
+
+def test_cache_hits_do_not_take_rate_limit_tokens(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TWELVE_DATA_API_KEY", "test")
+    config = DataProviderConfig(
+        provider_primary="twelvedata",
+        provider_fallback="twelvedata",
+        twelvedata={"base_url": "https://example.com/time_series"},
+        alphavantage={},
+        cache_enabled=True,
+        cache_ttl_seconds=60,
+        retry_max_attempts=1,
+        retry_base_delay_seconds=0.0,
+        retry_max_delay_seconds=0.0,
+        rate_limit_enabled=True,
+        rate_limit_min_interval_seconds=60.0,
+    )
+    cache = FileCache(tmp_path, ttl_seconds=60)
+    symbols = ["AAPL", "MSFT", "NVDA"]
+    for symbol in symbols:
+        cache.set(
+            f"twelvedata_{symbol}",
+            {"values": [{"datetime": "2024-01-02", "open": "1", "high": "2", "low": "0.5", "close": "1.5", "volume": "10"}]},
+        )
+    fetcher = MarketDataFetcher(config, cache=cache)
+    fetcher.session.get = Mock()
+    start = time.monotonic()
+    for symbol in symbols:
+        assert fetcher.fetch_daily(symbol)["close"].tolist() == [1.5]
+    assert time.monotonic() - start < 1.0
+    fetcher.session.get.assert_not_called()
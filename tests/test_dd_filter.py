@@ -61,3 +61,13 @@ def test_dd_filter_allows_when_within_max() -> None:
     indicators = compute_indicators(df)
     res = breakout_20d(df, indicators, volume_mult=0.0, dd_window=5, dd_max=0.2, symbol="TEST")
     assert res.reason != "drawdown_too_large"
+
+
+def test_precomputed_dd_peak_matches_fallback() -> None:
+    close = [100.0] * 25 + [60.0]
+    df = _build_df(close)
+    with_dd = compute_indicators(df, dd_window=5)
+    assert with_dd.dd_peak is not None
+    assert math.isclose(float(with_dd.dd_peak.iloc[-1]), 0.4, rel_tol=1e-9)
+    res = breakout_20d(df, with_dd, volume_mult=0.0, dd_window=5, dd_max=0.2, symbol="TEST")
+    assert res.reason == "drawdown_too_large"
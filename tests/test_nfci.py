@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.cache import FileCache
+from src.nfci import NfciFetcher
+
+_FRED_CSV = b"observation_date,NFCI\n2024-01-05,-0.5\n2024-01-12,.\n2024-01-19,-0.4\n"
+
+
+def _stub_session(fetcher: NfciFetcher) -> Mock:
+    response = Mock(content=_FRED_CSV)
+    fetcher.session.get = Mock(return_value=response)
+    return fetcher.session.get
+
+
+def test_fetch_series_reuses_shared_cache(tmp_path: Path) -> None:
+    cache = FileCache(tmp_path, ttl_seconds=60)
+    first = NfciFetcher("https://example.com/nfci.csv", cache=cache)
+    first_get = _stub_session(first)
+    series = first.fetch_series()
+    assert first_get.call_count == 1
+    assert list(series.dropna()) == [-0.5, -0.4]
+
+    second = NfciFetcher("https://example.com/nfci.csv", cache=cache)
+    second_get = _stub_session(second)
+    assert second.fetch_series().equals(series)
+    second_get.assert_not_called()
+
+
+def test_fetch_series_without_cache_downloads_each_time() -> None:
+    fetcher = NfciFetcher("https://example.com/nfci.csv")
+    get = _stub_session(fetcher)
+    fetcher.fetch_series()
+    fetcher.fetch_series()
+    assert get.call_count == 2
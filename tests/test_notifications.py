@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.notifications import (
+    MESSAGE_SEPARATOR,
+    NotificationMessage,
+    Notifier,
+    NotifierConfig,
+    _chunk_lines,
+)
+
+
+def _config() -> NotifierConfig:
+    return NotifierConfig(
+        slack_webhook=None,
+        pushover_user=None,
+        pushover_token=None,
+        smtp_host=None,
+        smtp_port=587,
+        smtp_user=None,
+        smtp_pass=None,
+        smtp_from=None,
+        smtp_to=None,
+        smtp_tls=True,
+    )
+
+
+def test_notify_many_sends_one_combined_message() -> None:
+    sent: list[NotificationMessage] = []
+    notifier = Notifier(slack_enabled=False, pushover_enabled=False, email_enabled=False, config=_config())
+    notifier.notify = sent.append  # type: ignore[method-assign]
+    notifier.notify_many(
+        "Alerts",
+        [NotificationMessage("a", "AAPL breakout"), NotificationMessage("b", "MSFT pullback")],
+    )
+    assert len(sent) == 1
+    assert sent[0].title == "Alerts"
+    assert sent[0].body == f"AAPL breakout{MESSAGE_SEPARATOR}MSFT pullback"
+
+
+def test_chunk_lines_respects_limit() -> None:
+    text = "\n".join(f"line {i}" for i in range(100))
+    chunks = _chunk_lines(text, 50)
+    assert all(len(c) <= 50 for c in chunks)
+    assert "\n".join(chunks) == text
+    assert _chunk_lines("x" * 120, 50) == ["x" * 50, "x" * 50, "x" * 20]
+    assert _chunk_lines("", 50) == [""]
+
+
+class _FakeSMTP:
+    instances: list["_FakeSMTP"] = []
+
+    def __init__(self, host: str, port: int, timeout: int) -> None:
+        self.sent: list[object] = []
+        self.closed = False
+        _FakeSMTP.instances.append(self)
+
+    def starttls(self) -> None:
+        pass
+
+    def login(self, user: str, password: str) -> None:
+        pass
+
+    def noop(self) -> tuple[int, bytes]:
+        return (250, b"OK")
+
+    def send_message(self, msg: object) -> None:
+        self.sent.append(msg)
+
+    def quit(self) -> None:
+        self.closed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_email_reuses_smtp_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("src.notifications.smtplib.SMTP", _FakeSMTP)
+    _FakeSMTP.instances = []
+    config = dataclasses.replace(
+        _config(),
+        smtp_host="smtp.example.com",
+        smtp_user="user",
+        smtp_pass="pass",
+        smtp_from="from@example.com",
+        smtp_to="to@example.com",
+    )
+    with Notifier(slack_enabled=False, pushover_enabled=False, email_enabled=True, config=config) as notifier:
+        notifier.notify(NotificationMessage("t1", "b1"))
+        notifier.notify(NotificationMessage("t2", "b2"))
+    assert len(_FakeSMTP.instances) == 1
+    assert len(_FakeSMTP.instances[0].sent) == 2
+    assert _FakeSMTP.instances[0].closed is True
+
+
+def test_notify_fans_out_to_backends_in_parallel(capsys: pytest.CaptureFixture[str]) -> None:
+    threads: list[str] = []
+
+    def fake_send(message: NotificationMessage) -> bool:
+        threads.append(threading.current_thread().name)
+        return True
+
+    with Notifier(slack_enabled=True, pushover_enabled=True, email_enabled=True, config=_config()) as notifier:
+        notifier._send_slack = fake_send  # type: ignore[method-assign]
+        notifier._send_pushover = fake_send  # type: ignore[method-assign]
+        notifier._send_email = fake_send  # type: ignore[method-assign]
+        notifier.notify(NotificationMessage("t", "b"))
+    assert len(threads) == 3
+    assert all(name.startswith("notify") for name in threads)
+    assert capsys.readouterr().out == ""
+
+
+def test_slack_server_error_falls_back_without_retrying() -> None:
+    hits: list[str] = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            hits.append(self.path)
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self.send_response(503)
+            self.end_headers()
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        config = dataclasses.replace(_config(), slack_webhook=f"http://127.0.0.1:{server.server_port}/hook")
+        with Notifier(slack_enabled=True, pushover_enabled=False, email_enabled=False, config=config) as notifier:
+            notifier._http.mount("http://", notifier._http.get_adapter("https://hooks.slack.com"))
+            assert notifier._send_slack(NotificationMessage("t", "b")) is False
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert hits == ["/hook"]
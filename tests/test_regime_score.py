@@ -56,3 +56,4 @@ def test_price_score_branches() -> None:
     assert _price_score(110.0, 100.0, 120.0) == 15
     assert _price_score(95.0, 100.0, 90.0) == 5
     assert _price_score(80.0, 100.0, 120.0) == 0
+
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+import src.sheets_logger as sheets_logger
+from src.market_regime import RegimeScoreResult
+
+
+class _FakeWorksheet:
+    def __init__(self) -> None:
+        self.id = 0
+        self.spreadsheet = mock.Mock()
+
+
+def _regime() -> RegimeScoreResult:
+    return RegimeScoreResult(
+        date="2024-01-02",
+        nfci_L=-0.5,
+        s_1w=0.0,
+        s_4w=0.0,
+        price_close=400.0,
+        ma50=390.0,
+        ma200=380.0,
+        price_score=30,
+        level_score=30.0,
+        trend_score=10.0,
+        abs_penalty=2.0,
+        total_score=68.0,
+        risk_off_trigger=False,
+        risk_on_trigger=False,
+        state="RISK_ON",
+        max_exposure=0.7,
+        allow_new_entries=True,
+        notes="",
+    )
+
+
+def test_rows_are_queued_and_flushed_in_one_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GOOGLE_SHEET_URL", "https://example.com/sheet")
+    monkeypatch.setenv("GOOGLE_SERVICE_ACCOUNT_FILE", "creds.json")
+    handle = sheets_logger._SheetHandle(worksheet=_FakeWorksheet())
+    monkeypatch.setattr(sheets_logger, "_get_worksheet", lambda *key: handle)
+
+    sheets_logger.append_regime_log(_regime(), [])
+    sheets_logger.append_regime_log(_regime(), [{"symbol": "AAPL", "close": "190.00"}])
+    sheets_logger.flush()
+
+    handle.worksheet.spreadsheet.batch_update.assert_called_once()
+    header_request, append_request = handle.worksheet.spreadsheet.batch_update.call_args.args[0]["requests"]
+    assert header_request["updateCells"]["start"] == {"sheetId": 0, "rowIndex": 0, "columnIndex": 0}
+    assert header_request["updateCells"]["rows"] == [sheets_logger._row_data(sheets_logger._HEADER)]
+    rows = append_request["appendCells"]["rows"]
+    assert len(rows) == 2
+    assert rows[1]["values"][-1] == {"userEnteredValue": {"stringValue": '[{"symbol":"AAPL","close":"190.00"}]'}}
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from src.indicators import compute_indicators
-from src.triggers import breakout_20d, pullback_25_bounce, pullback_50_bounce
+from src.triggers import (
+    breakout_20d,
+    pullback_25_bounce,
+    pullback_25_bounce_vec,
+    pullback_50_bounce,
+    pullback_50_bounce_vec,
+)
 
 
 def _build_df(close: list[float], low: list[float], high: list[float], volume: list[float]) -> pd.DataFrame:
@@ -50,3 +57,30 @@ def test_breakout_20d() -> None:
     indicators = compute_indicators(df)
     result = breakout_20d(df, indicators, volume_mult=1.2, dd_window=5, dd_max=0.5, symbol="TEST")
     assert bool(result.fired) is True
+
+
+def test_pullback_vec_matches_scalar() -> None:
+    cases = [
+        ([10.0] * 60, [9.9] * 60, [100.0] * 60),
+        ([10.0] * 59 + [9.0], [9.9] * 59 + [8.9], [100.0] * 60),
+        ([10.0] * 59 + [10.5], [9.9] * 59 + [10.4], [100.0] * 59 + [300.0]),
+        ([10.0] * 10, [9.9] * 10, [100.0] * 10),
+    ]
+    frames = [_build_df(c, l, [h + 0.2 for h in c], v) for c, l, v in cases]
+    inds = [compute_indicators(df) for df in frames]
+
+    def last(values: list[pd.Series]) -> np.ndarray:
+        return np.array([s.to_numpy()[-1] for s in values], dtype=np.float64)
+
+    lows = last([df["low"] for df in frames])
+    closes = last([df["close"] for df in frames])
+    volumes = last([df["volume"] for df in frames])
+    fired_25 = pullback_25_bounce_vec(
+        lows, closes, volumes, last([i.sma25 for i in inds]), last([i.vol_ma20 for i in inds]), tol=0.005
+    )
+    fired_50 = pullback_50_bounce_vec(
+        lows, closes, last([i.sma50 for i in inds]), last([i.drawdown_20d for i in inds]), tol=0.005, drawdown_20d_max=0.15
+    )
+    for k, (df, ind) in enumerate(zip(frames, inds)):
+        assert bool(fired_25[k]) is bool(pullback_25_bounce(df, ind, tol=0.005).fired)
+        assert bool(fired_50[k]) is bool(pullback_50_bounce(df, ind, tol=0.005, drawdown_20d_max=0.15).fired)